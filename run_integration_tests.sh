@@ -20,30 +20,15 @@ if ! command -v docker &> /dev/null; then
     exit 1
 fi
 
-# Clean up any existing test containers
-echo "🧹 Cleaning up existing test containers..."
-docker stop devmeter-integration-test 2>/dev/null || true
-docker rm devmeter-integration-test 2>/dev/null || true
-docker rmi devmeter-test 2>/dev/null || true
-
 # Install test dependencies
 echo "📦 Installing test dependencies..."
 pip install -r requirements-dev.txt
 
-# Build the test image
-echo "🏗️ Building DevMeter test image..."
-docker build -t devmeter-test .
-
-# Run the integration tests
+# Run the integration tests; the fixtures build or reuse the image and manage the
+# container, and the image stays warm for the next run (see `make clean-test-images`)
 echo "🧪 Running integration tests..."
 python -m pytest tests/test_integration.py -v -s --tb=short
 
-# Clean up
-echo "🧹 Cleaning up test resources..."
-docker stop devmeter-integration-test 2>/dev/null || true
-docker rm devmeter-integration-test 2>/dev/null || true
-docker rmi devmeter-test 2>/dev/null || true
-
 echo ""
 echo "🎉 Integration tests completed successfully!"
 echo "✅ Real DevMeter application tested with live HTTP calls"
\ No newline at end of file
@@ -47,7 +47,6 @@ if command -v docker &> /dev/null; then
     echo "🧹 Cleaning up test container..."
     docker stop devmeter-test-container
     docker rm devmeter-test-container
-    docker rmi devmeter-test
 fi
 
 echo ""
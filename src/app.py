@@ -3,19 +3,236 @@ GitHub Profile Analyzer - DevMeter
 A Rotten Tomato-style rating system for developer hireability
 """
 
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from github import Github
+from cachetools import LRUCache, TTLCache
+import orjson
+import requests
 import os
 import re
-from datetime import datetime, timedelta
+import threading
+from collections import Counter
+from itertools import islice
+from datetime import datetime, timedelta, timezone
 import logging
-from typing import Dict, List, Optional, Tuple
+from operator import attrgetter, mul
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Optional persistent cache of GitHub API responses (used by the integration tests)
+HTTP_CACHE_PATH = os.getenv('DEVMETER_HTTP_CACHE')
+if HTTP_CACHE_PATH:
+    import requests_cache
+    requests_cache.install_cache(HTTP_CACHE_PATH, backend='sqlite', expire_after=3600,
+                                 allowable_methods=('GET', 'HEAD', 'POST'))
+    # Opening the cache connects to SQLite; close it so a preloading server doesn't
+    # share that connection across forked workers, each of which reopens its own
+    requests_cache.get_cache().close()
+    logger.info(f"Caching GitHub API responses in {HTTP_CACHE_PATH}")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson's C encoder"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as a JSON string (supports default, sort_keys and indent=2)"""
+        return self._encode(obj, **kwargs).decode('utf-8')
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        """Deserialize JSON from a string or UTF-8 bytes"""
+        if kwargs:
+            raise TypeError(f"orjson.loads() takes no options: {', '.join(kwargs)}")
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Build a JSON response straight from the encoded bytes"""
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self._encode(obj, indent=2 if pretty else None),
+                                        mimetype=self.mimetype)
+
+    def _encode(self, obj: Any, default=None, sort_keys: Optional[bool] = None,
+                indent: Optional[int] = None, separators=None, **kwargs: Any) -> bytes:
+        """Encode with orjson; datetimes are serialized natively as ISO 8601"""
+        # separators is ignored: orjson is always compact, which is what Flask's
+        # session serializer asks for
+        if kwargs:
+            raise TypeError(f"Unsupported JSON options for orjson: {', '.join(kwargs)}")
+        if indent not in (None, 0, 2):
+            raise ValueError("orjson only supports indent=2")
+
+        option = 0
+        if self.sort_keys if sort_keys is None else sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default or self.default, option=option)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+_POPULAR_LANGS = frozenset({
+    'Python', 'JavaScript', 'TypeScript', 'Go', 'Rust', 'Java', 'C++', 'C#'
+})
+
+
+def activity_score(repo_count: int, recent_activity: int) -> float:
+    """Activity level from repository count and recent activity"""
+    if not repo_count and not recent_activity:
+        return 0.0
+
+    # Base score from repository count
+    repo_score = min(1.0, repo_count / 20.0)  # Max at 20 repos
+
+    # Recent activity bonus
+    activity_bonus = min(0.5, recent_activity / 10.0)  # Max bonus at 10 recent activities
+
+    return min(1.0, repo_score + activity_bonus)
+
+
+def quality_score(language_count: int, popular_count: int) -> float:
+    """Code quality from language diversity and popular language use"""
+    if not language_count and not popular_count:
+        return 0.0
+
+    # Language diversity bonus
+    lang_diversity = min(1.0, language_count / 5.0)  # Max at 5 languages
+
+    # Popular languages bonus
+    popular_bonus = min(0.5, popular_count / 3.0)  # Max bonus at 3 popular languages
+
+    return min(1.0, (lang_diversity * 0.7) + (popular_bonus * 0.3))
+
+
+def collaboration_score(repo_count: int, fork_count: int, followers: int, following: int) -> float:
+    """Collaboration from original work and followers/following ratio"""
+    if repo_count == 0:
+        return 0.0
+
+    # Prefer original work (inverse of fork ratio)
+    originality_score = 1.0 - fork_count / repo_count
+
+    # Followers/following ratio
+    social_score = min(1.0, followers / following) if following > 0 else 0.0
+
+    return min(1.0, (originality_score * 0.7) + (social_score * 0.3))
+
+
+def consistency_score(repo_count: int, recent_repo_count: int) -> float:
+    """Consistency from the share of repositories updated in the last year"""
+    if repo_count == 0:
+        return 0.0
+
+    consistency_ratio = recent_repo_count / repo_count
+    return min(1.0, consistency_ratio * 1.5)  # Boost for consistency
+
+
+def expertise_score(focus_count: int, language_count: int) -> float:
+    """Expertise from focus area diversity and technical depth"""
+    if not focus_count and not language_count:
+        return 0.0
+
+    # Diversity of focus areas
+    area_score = min(1.0, focus_count / 3.0)  # Max at 3 areas
+
+    # Technical depth (more languages = more expertise)
+    depth_score = min(1.0, language_count / 4.0)  # Max at 4 languages
+
+    return min(1.0, (area_score * 0.6) + (depth_score * 0.4))
+
+
+def impact_score(repo_count: int, total_stars: int) -> float:
+    """Impact from stars per repository"""
+    if repo_count == 0:
+        return 0.0
+
+    avg_stars = total_stars / repo_count
+    return min(1.0, avg_stars / 10.0)  # Max at 10 stars per repo
+
+
+def _to_percentage(total_score: float) -> int:
+    """Convert a weighted total to a clamped integer percentage"""
+    return min(100, max(0, int(total_score * 100)))
+
+
+class ProfileStats(NamedTuple):
+    """Scalar inputs to the category scorers, gathered in one pass over a profile"""
+    repo_count: int
+    recent_activity: int
+    language_count: int
+    popular_count: int
+    fork_count: int
+    recent_repo_count: int
+    focus_count: int
+    total_stars: int
+    followers: int
+    following: int
+
+
+# Columns of a DevMeter.score_batch row
+BATCH_FEATURES = ProfileStats._fields
+
+
+def _popular_count(languages: List[Tuple[str, int]]) -> int:
+    """Number of (language, count) entries that are popular languages"""
+    return sum(1 for lang, _ in languages if lang in _POPULAR_LANGS)
+
+
+def _preaggregate(data: Dict) -> ProfileStats:
+    """Walk the repositories once and collect every scorer input"""
+    repos = data.get('repositories', [])
+    languages = data.get('languages', [])
+    profile = data.get('profile', {})
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=365)
+    fork_count = 0
+    recent_repo_count = 0
+    for repo in repos:
+        if repo.get('is_fork', False):
+            fork_count += 1
+
+        # Check for regular updates
+        if _updated_since(repo.get('updated_at'), cutoff):
+            recent_repo_count += 1
+
+    return ProfileStats(
+        repo_count=len(repos),
+        recent_activity=data.get('recent_activity', 0),
+        language_count=len(languages),
+        popular_count=_popular_count(languages),
+        fork_count=fork_count,
+        recent_repo_count=recent_repo_count,
+        focus_count=len(data.get('focus_areas', [])),
+        total_stars=data.get('total_stars_received', 0),
+        followers=profile.get('followers', 0),
+        following=profile.get('following', 1)
+    )
+
+
+def _category_scores(repo_count, recent_activity, language_count, popular_count, fork_count,
+                     recent_repo_count, focus_count, total_stars, followers,
+                     following) -> Tuple[float, ...]:
+    """Score every category, in DevMeter weight order, from ProfileStats fields"""
+    return (
+        # Activity Level (25%): Based on repos, commits, contributions
+        activity_score(repo_count, recent_activity),
+        # Code Quality (20%): Languages used, project complexity
+        quality_score(language_count, popular_count),
+        # Collaboration (15%): Forks, PRs, issues
+        collaboration_score(repo_count, fork_count, followers, following),
+        # Consistency (15%): Regular activity, maintenance
+        consistency_score(repo_count, recent_repo_count),
+        # Expertise (15%): Language diversity, project types
+        expertise_score(focus_count, language_count),
+        # Impact (10%): Stars, forks, community influence
+        impact_score(repo_count, total_stars)
+    )
+
 
 class DevMeter:
     """DevMeter rating system - like Rotten Tomatoes for developers"""
@@ -29,40 +246,32 @@ class DevMeter:
             'expertise': 0.15,
             'impact': 0.10
         }
+        # Fixed category order shared by the weight vector and the scores
+        self._weight_order = tuple(self.weights)
+        self._weight_values = tuple(self.weights.values())
 
     def calculate_rating(self, profile_data: Dict) -> Dict:
         """Calculate DevMeter score and rating"""
-        scores = {}
-
-        # Activity Level (25%): Based on repos, commits, contributions
-        activity_score = self._calculate_activity_score(profile_data)
-        scores['activity_level'] = activity_score
-
-        # Code Quality (20%): Languages used, project complexity
-        quality_score = self._calculate_quality_score(profile_data)
-        scores['code_quality'] = quality_score
-
-        # Collaboration (15%): Forks, PRs, issues
-        collab_score = self._calculate_collaboration_score(profile_data)
-        scores['collaboration'] = collab_score
-
-        # Consistency (15%): Regular activity, maintenance
-        consistency_score = self._calculate_consistency_score(profile_data)
-        scores['consistency'] = consistency_score
+        stats = _preaggregate(profile_data)
+
+        # Nothing to score: every category is zero
+        if not (stats.repo_count or stats.recent_activity
+                or stats.language_count or stats.focus_count):
+            return {
+                'score': 0,
+                'rating': self._get_rating_category(0),
+                'category_scores': dict.fromkeys(self._weight_order, 0.0),
+                'recommendation': self._get_recommendation(0)
+            }
 
-        # Expertise (15%): Language diversity, project types
-        expertise_score = self._calculate_expertise_score(profile_data)
-        scores['expertise'] = expertise_score
-
-        # Impact (10%): Stars, forks, community influence
-        impact_score = self._calculate_impact_score(profile_data)
-        scores['impact'] = impact_score
+        values = _category_scores(*stats)
 
         # Calculate weighted total
-        total_score = sum(scores[category] * self.weights[category] for category in scores)
+        total_score = sum(map(mul, values, self._weight_values))
+        scores = dict(zip(self._weight_order, values))
 
         # Convert to percentage and determine rating
-        percentage = min(100, max(0, int(total_score * 100)))
+        percentage = _to_percentage(total_score)
 
         rating = self._get_rating_category(percentage)
 
@@ -73,104 +282,46 @@ class DevMeter:
             'recommendation': self._get_recommendation(percentage)
         }
 
+    def score_batch(self, rows: Iterable[Sequence[float]]) -> List[int]:
+        """Score many profiles from precomputed BATCH_FEATURES rows"""
+        weights = self._weight_values
+        return [_to_percentage(sum(map(mul, _category_scores(*row), weights))) for row in rows]
+
+    # Single-category scorers; each reads only the fields its kernel needs, so
+    # none pays for _preaggregate's full pass
     def _calculate_activity_score(self, data: Dict) -> float:
         """Calculate activity level score"""
-        repos = data.get('repositories', [])
-        recent_activity = data.get('recent_activity', 0)
-
-        # Base score from repository count
-        repo_score = min(1.0, len(repos) / 20.0)  # Max at 20 repos
-
-        # Recent activity bonus
-        activity_bonus = min(0.5, recent_activity / 10.0)  # Max bonus at 10 recent activities
-
-        return min(1.0, repo_score + activity_bonus)
+        return activity_score(len(data.get('repositories', [])), data.get('recent_activity', 0))
 
     def _calculate_quality_score(self, data: Dict) -> float:
         """Calculate code quality score"""
         languages = data.get('languages', [])
-        repos = data.get('repositories', [])
-
-        # Language diversity bonus
-        lang_diversity = min(1.0, len(languages) / 5.0)  # Max at 5 languages
-
-        # Popular languages bonus
-        popular_langs = {'Python', 'JavaScript', 'TypeScript', 'Go', 'Rust', 'Java', 'C++', 'C#'}
-        popular_count = sum(1 for lang, _ in languages if lang in popular_langs)
-        popular_bonus = min(0.5, popular_count / 3.0)  # Max bonus at 3 popular languages
-
-        return min(1.0, (lang_diversity * 0.7) + (popular_bonus * 0.3))
+        return quality_score(len(languages), _popular_count(languages))
 
     def _calculate_collaboration_score(self, data: Dict) -> float:
         """Calculate collaboration score"""
         repos = data.get('repositories', [])
         profile = data.get('profile', {})
-
-        # Fork ratio (lower is better - indicates original work)
-        total_repos = len(repos)
-        if total_repos == 0:
-            return 0.0
-
         fork_count = sum(1 for repo in repos if repo.get('is_fork', False))
-        fork_ratio = fork_count / total_repos
-
-        # Prefer original work (inverse of fork ratio)
-        originality_score = 1.0 - fork_ratio
-
-        # Followers/following ratio
-        followers = profile.get('followers', 0)
-        following = profile.get('following', 1)  # Avoid division by zero
-        social_score = min(1.0, followers / following) if following > 0 else 0.0
-
-        return min(1.0, (originality_score * 0.7) + (social_score * 0.3))
+        return collaboration_score(len(repos), fork_count,
+                                   profile.get('followers', 0), profile.get('following', 1))
 
     def _calculate_consistency_score(self, data: Dict) -> float:
         """Calculate consistency score"""
         repos = data.get('repositories', [])
-
-        if not repos:
-            return 0.0
-
-        # Check for regular updates
-        recent_repos = []
-        for repo in repos:
-            if repo.get('updated_at'):
-                try:
-                    updated = datetime.fromisoformat(repo['updated_at'].replace('Z', '+00:00'))
-                    if updated > datetime.now() - timedelta(days=365):
-                        recent_repos.append(repo)
-                except:
-                    continue
-
-        consistency_ratio = len(recent_repos) / len(repos)
-        return min(1.0, consistency_ratio * 1.5)  # Boost for consistency
+        cutoff = datetime.now(timezone.utc) - timedelta(days=365)
+        recent_repo_count = sum(
+            1 for repo in repos if _updated_since(repo.get('updated_at'), cutoff)
+        )
+        return consistency_score(len(repos), recent_repo_count)
 
     def _calculate_expertise_score(self, data: Dict) -> float:
         """Calculate expertise score"""
-        focus_areas = data.get('focus_areas', [])
-        languages = data.get('languages', [])
-
-        # Diversity of focus areas
-        area_score = min(1.0, len(focus_areas) / 3.0)  # Max at 3 areas
-
-        # Technical depth (more languages = more expertise)
-        depth_score = min(1.0, len(languages) / 4.0)  # Max at 4 languages
-
-        return min(1.0, (area_score * 0.6) + (depth_score * 0.4))
+        return expertise_score(len(data.get('focus_areas', [])), len(data.get('languages', [])))
 
     def _calculate_impact_score(self, data: Dict) -> float:
         """Calculate impact score"""
-        total_stars = data.get('total_stars_received', 0)
-        repos = data.get('repositories', [])
-
-        # Stars per repository
-        if repos:
-            avg_stars = total_stars / len(repos)
-            star_score = min(1.0, avg_stars / 10.0)  # Max at 10 stars per repo
-        else:
-            star_score = 0.0
-
-        return star_score
+        return impact_score(len(data.get('repositories', [])), data.get('total_stars_received', 0))
 
     def _get_rating_category(self, percentage: int) -> str:
         """Get rating category based on percentage"""
@@ -201,74 +352,220 @@ class DevMeter:
             return "Strong pass - major red flags present"
 
 
+_GH_URL_RE = re.compile(r'github\.com/([^/?#]+)')
+
+
 def extract_username_from_url(url: str) -> Optional[str]:
     """Extract username from GitHub URL"""
-    match = re.search(r'github\.com/([^/?]+)', url)
+    match = _GH_URL_RE.search(url)
     return match.group(1) if match else None
 
 
-def analyze_github_profile(username: str, token: Optional[str] = None) -> Dict:
-    """Analyze GitHub profile programmatically"""
+GITHUB_API_URL = 'https://api.github.com'
+GITHUB_GRAPHQL_URL = f'{GITHUB_API_URL}/graphql'
+
+# Most recently updated repositories considered per profile
+REPO_LIMIT = 30
+
+PROFILE_QUERY = """
+query($login: String!, $first: Int!) {
+  user(login: $login) {
+    login
+    name
+    bio
+    location
+    company
+    websiteUrl
+    followers { totalCount }
+    following { totalCount }
+    publicRepos: repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+    gists(privacy: PUBLIC) { totalCount }
+    repositories(first: $first, privacy: PUBLIC, ownerAffiliations: OWNER,
+                 orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes {
+        name
+        description
+        primaryLanguage { name }
+        stargazerCount
+        forkCount
+        createdAt
+        updatedAt
+        isFork
+      }
+    }
+  }
+}
+"""
+
 
-    # Initialize GitHub client
-    g = Github(token) if token else Github()
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a GitHub ISO 8601 timestamp into an aware UTC datetime"""
+    # fromisoformat only accepts the 'Z' suffix from Python 3.11
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
 
+
+def _format_timestamp(value: Optional[datetime]) -> Optional[str]:
+    """Format a REST datetime like GraphQL's timestamps (ISO 8601 UTC, 'Z' suffix)"""
+    if value is None:
+        return None
+    # PyGithub 1.x returns naive datetimes in UTC
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _updated_since(updated_at: Optional[str], cutoff: datetime) -> bool:
+    """Whether a timestamp is after the cutoff; missing or malformed ones never are"""
+    if not updated_at:
+        return False
     try:
-        # Get user object
-        user = g.get_user(username)
-
-        # Basic profile info
-        profile = {
-            'username': user.login,
-            'name': user.name,
-            'bio': user.bio,
-            'location': user.location,
-            'company': user.company,
-            'website': user.blog,
-            'followers': user.followers,
-            'following': user.following,
-            'public_repos': user.public_repos,
-            'public_gists': user.public_gists
-        }
+        return _parse_timestamp(updated_at) > cutoff
+    except ValueError:
+        return False
+
+
+class RepoRow(NamedTuple):
+    """Repository fields used by the analysis, one row per fetched repository"""
+    name: str
+    description: Optional[str]
+    language: Optional[str]
+    stars: int
+    forks: int
+    created_at: Optional[str]
+    updated_at: Optional[str]
+    is_fork: bool
+
+
+def _fetch_profile_graphql(username: str, token: str) -> Tuple[Dict, List[RepoRow], None]:
+    """Fetch profile and repositories with a single GraphQL v4 query (no ETags)"""
+    response = requests.post(
+        GITHUB_GRAPHQL_URL,
+        json={'query': PROFILE_QUERY, 'variables': {'login': username, 'first': REPO_LIMIT}},
+        headers={'Authorization': f'bearer {token}'},
+        timeout=30
+    )
+    response.raise_for_status()
+    payload = response.json()
+
+    if payload.get('errors'):
+        raise ValueError(payload['errors'][0].get('message', 'GraphQL query failed'))
+
+    user = (payload.get('data') or {}).get('user')
+    if user is None:
+        raise ValueError(f"User {username} not found")
+
+    profile = {
+        'username': user['login'],
+        'name': user['name'],
+        'bio': user['bio'],
+        'location': user['location'],
+        'company': user['company'],
+        'website': user['websiteUrl'],
+        'followers': user['followers']['totalCount'],
+        'following': user['following']['totalCount'],
+        'public_repos': user['publicRepos']['totalCount'],
+        'public_gists': user['gists']['totalCount']
+    }
 
-        # Get repositories (limit for performance)
-        repos = []
-        languages = {}
-        total_stars = 0
-        recent_activity = 0
-
-        for repo in user.get_repos()[:30]:  # Limit to 30 repos
-            repo_info = {
-                'name': repo.name,
-                'description': repo.description,
-                'language': repo.language,
-                'stars': repo.stargazers_count,
-                'forks': repo.forks_count,
-                'created_at': repo.created_at.isoformat() if repo.created_at else None,
-                'updated_at': repo.updated_at.isoformat() if repo.updated_at else None,
-                'is_fork': repo.fork
-            }
-            repos.append(repo_info)
+    repos = [
+        RepoRow(
+            name=node['name'],
+            description=node['description'],
+            language=(node['primaryLanguage'] or {}).get('name'),
+            stars=node['stargazerCount'],
+            forks=node['forkCount'],
+            created_at=node['createdAt'],
+            updated_at=node['updatedAt'],
+            is_fork=node['isFork']
+        )
+        for node in user['repositories']['nodes']
+    ]
+
+    return profile, repos, None
+
+
+def _fetch_profile_rest(username: str, token: Optional[str] = None
+                        ) -> Tuple[Dict, List[RepoRow], Optional[Tuple[str, str]]]:
+    """Fetch profile and repositories through the REST API, with the ETags of both responses"""
+    # One page of REPO_LIMIT covers the whole slice in a single request
+    g = Github(token, per_page=REPO_LIMIT)
+    user = g.get_user(username)
+
+    profile = {
+        'username': user.login,
+        'name': user.name,
+        'bio': user.bio,
+        'location': user.location,
+        'company': user.company,
+        'website': user.blog,
+        'followers': user.followers,
+        'following': user.following,
+        'public_repos': user.public_repos,
+        'public_gists': user.public_gists
+    }
+
+    # Only read fields present in the listing payload so no repo lazily completes
+    repos = []
+    listing_etag = None
+    for repo in islice(user.get_repos(sort='updated', direction='desc'), REPO_LIMIT):
+        # Every repo carries the headers of the listing page it came from
+        listing_etag = listing_etag or repo.etag
+        repos.append(RepoRow(
+            name=repo.name,
+            description=repo.description,
+            language=repo.language,
+            stars=repo.stargazers_count,
+            forks=repo.forks_count,
+            created_at=_format_timestamp(repo.created_at),
+            updated_at=_format_timestamp(repo.updated_at),
+            is_fork=repo.fork
+        ))
+
+    etags = (user.etag, listing_etag) if user.etag and listing_etag else None
+    return profile, repos, etags
 
-            # Count languages
-            if repo.language:
-                languages[repo.language] = languages.get(repo.language, 0) + 1
 
-            # Count recent activity
-            if repo.updated_at and repo.updated_at > datetime.now() - timedelta(days=90):
-                recent_activity += 1
+def analyze_github_profile(username: str, token: Optional[str] = None) -> Dict:
+    """Analyze GitHub profile programmatically"""
+    return _analyze_profile(username, token)[0]
 
-            total_stars += repo.stargazers_count
 
-        # Sort languages by usage
-        languages = sorted(languages.items(), key=lambda x: x[1], reverse=True)
+def _analyze_profile(username: str, token: Optional[str] = None
+                     ) -> Tuple[Dict, Optional[Tuple[str, str]]]:
+    """Analyze GitHub profile, also returning the fetched ETags when available"""
+
+    try:
+        # GraphQL requires authentication; fall back to REST without a token
+        if token:
+            profile, repos, etags = _fetch_profile_graphql(username, token)
+        else:
+            profile, repos, etags = _fetch_profile_rest(username)
+
+        # Count languages, most used first
+        languages = Counter(filter(None, map(attrgetter('language'), repos))).most_common()
+
+        total_stars = sum(map(attrgetter('stars'), repos))
+
+        # Count recent activity
+        cutoff = datetime.now(timezone.utc) - timedelta(days=90)
+        recent_activity = sum(
+            1 for updated_at in map(attrgetter('updated_at'), repos)
+            if _updated_since(updated_at, cutoff)
+        )
 
         # Determine focus areas
-        focus_areas = determine_focus_areas(repos)
+        focus_text = _focus_text((repo.name, repo.description) for repo in repos)
+        focus_areas = _match_focus_areas(focus_text)
 
         profile_data = {
             'profile': profile,
-            'repositories': repos[:6],  # Show top 6 like GitHub
+            # Show top 6 like GitHub; only displayed repos become dicts
+            'repositories': [repo._asdict() for repo in repos[:6]],
             'languages': languages,
             'total_stars_received': total_stars,
             'focus_areas': focus_areas,
@@ -280,198 +577,286 @@ def analyze_github_profile(username: str, token: Optional[str] = None) -> Dict:
         rating = devmeter.calculate_rating(profile_data)
         profile_data['devmeter'] = rating
 
-        return profile_data
+        return profile_data, etags
 
     except Exception as e:
         logger.error(f"Error analyzing profile {username}: {str(e)}")
-        return {'error': str(e)}
+        return {'error': str(e)}, None
+
+
+# Fresh analyses, keyed by (username, authenticated)
+_PROFILE_CACHE = TTLCache(maxsize=1024, ttl=900)
+# Last known ETags, analysis and fetch time per key, kept past the TTL for revalidation
+_PROFILE_VALIDATORS = LRUCache(maxsize=1024)
+_CACHE_LOCK = threading.Lock()
+
+# Unchanged ETags don't stop recent activity and consistency from aging, so
+# older analyses are recomputed regardless
+VALIDATOR_MAX_AGE = timedelta(days=90)
+
+
+def _etags_unchanged(username: str, etags: Tuple[str, str]) -> bool:
+    """Revalidate the user and repository listing ETags; True only if both are unchanged"""
+    # Only the anonymous REST fetch yields ETags, so requests go unauthenticated
+    headers = {'Accept': 'application/vnd.github+json'}
+
+    # Same resources _fetch_profile_rest reads, so the ETags are comparable
+    urls = (
+        f'{GITHUB_API_URL}/users/{username}',
+        f'{GITHUB_API_URL}/users/{username}/repos?sort=updated&direction=desc&per_page={REPO_LIMIT}'
+    )
+
+    try:
+        for url, etag in zip(urls, etags):
+            # 304 responses don't count against the rate limit
+            response = requests.head(url, headers={**headers, 'If-None-Match': etag}, timeout=10)
+            if response.status_code != 304:
+                # Changed (or failed); a full fetch follows, so skip the rest
+                return False
+    except requests.RequestException as e:
+        logger.warning(f"ETag check failed for {username}: {str(e)}")
+        return False
+
+    return True
+
+
+def get_profile_cached(username: str, token: Optional[str] = None) -> Dict:
+    """Analyze GitHub profile, reusing recent or unchanged results"""
+    key = (username.lower(), bool(token))
+
+    with _CACHE_LOCK:
+        cached = _PROFILE_CACHE.get(key)
+        stale = _PROFILE_VALIDATORS.get(key)
+
+    if cached is not None:
+        return cached
+
+    # Only a previously seen, recent enough profile is worth a conditional request
+    now = datetime.now(timezone.utc)
+    if (stale is not None and now - stale[2] < VALIDATOR_MAX_AGE
+            and _etags_unchanged(username, stale[0])):
+        etags, result, fetched_at = stale
+    else:
+        result, etags = _analyze_profile(username, token)
+        fetched_at = now
+
+    if 'error' not in result:
+        with _CACHE_LOCK:
+            _PROFILE_CACHE[key] = result
+            if etags:
+                _PROFILE_VALIDATORS[key] = (etags, result, fetched_at)
+
+    return result
+
+
+FOCUS_KEYWORDS = {
+    'web': ['web', 'frontend', 'backend', 'api', 'rest', 'http', 'flask', 'django', 'react', 'vue', 'angular'],
+    'data': ['data', 'analytics', 'machine learning', 'ml', 'ai', 'statistics', 'pandas', 'numpy', 'tensorflow', 'pytorch'],
+    'devops': ['docker', 'kubernetes', 'ci/cd', 'deployment', 'cloud', 'aws', 'gcp', 'azure', 'terraform', 'ansible'],
+    'security': ['security', 'auth', 'encryption', 'privacy', 'penetration', 'hacking', 'cybersecurity'],
+    'mobile': ['android', 'ios', 'mobile', 'react native', 'flutter', 'swift', 'kotlin'],
+    'gaming': ['game', 'gaming', 'unity', 'unreal', 'godot', 'phaser'],
+    'finance': ['trading', 'finance', 'stock', 'crypto', 'blockchain', 'bitcoin', 'ethereum'],
+    'iot': ['iot', 'internet of things', 'arduino', 'raspberry pi', 'embedded'],
+    'automation': ['automation', 'scripting', 'bash', 'powershell', 'selenium']
+}
+
+# One alternation per area, so each area is a single scan of the text
+_FOCUS_PATTERNS = [
+    (area, re.compile('|'.join(re.escape(keyword) for keyword in keywords)))
+    for area, keywords in FOCUS_KEYWORDS.items()
+]
 
 
 def determine_focus_areas(repos: List[Dict]) -> List[str]:
     """Determine focus areas based on repository content"""
-    focus_areas = []
-    descriptions = [r.get('description', '') for r in repos if r.get('description')]
-    names = [r.get('name', '') for r in repos]
-
-    all_text = ' '.join(descriptions + names).lower()
-
-    focus_keywords = {
-        'web': ['web', 'frontend', 'backend', 'api', 'rest', 'http', 'flask', 'django', 'react', 'vue', 'angular'],
-        'data': ['data', 'analytics', 'machine learning', 'ml', 'ai', 'statistics', 'pandas', 'numpy', 'tensorflow', 'pytorch'],
-        'devops': ['docker', 'kubernetes', 'ci/cd', 'deployment', 'cloud', 'aws', 'gcp', 'azure', 'terraform', 'ansible'],
-        'security': ['security', 'auth', 'encryption', 'privacy', 'penetration', 'hacking', 'cybersecurity'],
-        'mobile': ['android', 'ios', 'mobile', 'react native', 'flutter', 'swift', 'kotlin'],
-        'gaming': ['game', 'gaming', 'unity', 'unreal', 'godot', 'phaser'],
-        'finance': ['trading', 'finance', 'stock', 'crypto', 'blockchain', 'bitcoin', 'ethereum'],
-        'iot': ['iot', 'internet of things', 'arduino', 'raspberry pi', 'embedded'],
-        'automation': ['automation', 'scripting', 'bash', 'powershell', 'selenium']
-    }
+    return _match_focus_areas(_focus_text((r.get('name', ''), r.get('description')) for r in repos))
 
-    for area, keywords in focus_keywords.items():
-        if any(keyword in all_text for keyword in keywords):
-            focus_areas.append(area)
+
+def _focus_text(repos: Iterable[Tuple[str, Optional[str]]]) -> str:
+    """Lowercased descriptions then names of (name, description) pairs, for focus matching"""
+    descriptions = []
+    names = []
+    for name, description in repos:
+        if description:
+            descriptions.append(description)
+        names.append(name)
+
+    return ' '.join(descriptions + names).lower()
+
+
+def _match_focus_areas(all_text: str) -> List[str]:
+    """Match lowercased repository text against the focus area keywords"""
+    focus_areas = [area for area, pattern in _FOCUS_PATTERNS if pattern.search(all_text)]
 
     return focus_areas[:5]  # Limit to top 5 areas
 
 
-@app.route('/', methods=['GET'])
-def index():
-    """Serve the main web interface"""
-    html = """
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>DevMeter - GitHub Developer Rating</title>
-        <style>
-            body {
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                max-width: 800px;
-                margin: 0 auto;
-                padding: 20px;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                min-height: 100vh;
-                color: white;
-            }
-            .container {
-                background: rgba(255, 255, 255, 0.1);
-                padding: 30px;
-                border-radius: 10px;
-                backdrop-filter: blur(10px);
-                box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-            }
-            h1 {
-                text-align: center;
-                margin-bottom: 30px;
-                font-size: 2.5em;
-            }
-            .subtitle {
-                text-align: center;
-                margin-bottom: 30px;
-                opacity: 0.9;
-                font-size: 1.2em;
-            }
-            .form-group {
-                margin-bottom: 20px;
-            }
-            label {
-                display: block;
-                margin-bottom: 8px;
-                font-weight: 600;
-            }
-            input[type="text"] {
-                width: 100%;
-                padding: 12px;
-                border: none;
-                border-radius: 5px;
-                font-size: 16px;
-                background: rgba(255, 255, 255, 0.9);
-                color: #333;
-            }
-            button {
-                background: #ff6b6b;
-                color: white;
-                padding: 12px 30px;
-                border: none;
-                border-radius: 5px;
-                font-size: 16px;
-                cursor: pointer;
-                width: 100%;
-                transition: background 0.3s;
-            }
-            button:hover {
-                background: #ff5252;
-            }
-            .example {
-                text-align: center;
-                margin-top: 20px;
-                opacity: 0.8;
-                font-size: 0.9em;
-            }
-            .rating-display {
-                text-align: center;
-                margin-top: 30px;
-                padding: 20px;
-                background: rgba(255, 255, 255, 0.1);
-                border-radius: 10px;
-            }
-            .score {
-                font-size: 3em;
-                font-weight: bold;
-                margin: 10px 0;
-            }
-            .rating {
-                font-size: 1.5em;
-                margin: 10px 0;
-            }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>🍅 DevMeter</h1>
-            <p class="subtitle">Rate developers like Rotten Tomatoes rates movies</p>
-
-            <form id="analyzeForm">
-                <div class="form-group">
-                    <label for="githubUrl">GitHub Profile URL</label>
-                    <input type="text" id="githubUrl" name="url"
-                           placeholder="https://github.com/username"
-                           required>
-                </div>
-                <button type="submit">Analyze Profile</button>
-            </form>
-
-            <div class="example">
-                Example: https://github.com/octocat
+INDEX_HTML = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>DevMeter - GitHub Developer Rating</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            min-height: 100vh;
+            color: white;
+        }
+        .container {
+            background: rgba(255, 255, 255, 0.1);
+            padding: 30px;
+            border-radius: 10px;
+            backdrop-filter: blur(10px);
+            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
+        }
+        h1 {
+            text-align: center;
+            margin-bottom: 30px;
+            font-size: 2.5em;
+        }
+        .subtitle {
+            text-align: center;
+            margin-bottom: 30px;
+            opacity: 0.9;
+            font-size: 1.2em;
+        }
+        .form-group {
+            margin-bottom: 20px;
+        }
+        label {
+            display: block;
+            margin-bottom: 8px;
+            font-weight: 600;
+        }
+        input[type="text"] {
+            width: 100%;
+            padding: 12px;
+            border: none;
+            border-radius: 5px;
+            font-size: 16px;
+            background: rgba(255, 255, 255, 0.9);
+            color: #333;
+        }
+        button {
+            background: #ff6b6b;
+            color: white;
+            padding: 12px 30px;
+            border: none;
+            border-radius: 5px;
+            font-size: 16px;
+            cursor: pointer;
+            width: 100%;
+            transition: background 0.3s;
+        }
+        button:hover {
+            background: #ff5252;
+        }
+        .example {
+            text-align: center;
+            margin-top: 20px;
+            opacity: 0.8;
+            font-size: 0.9em;
+        }
+        .rating-display {
+            text-align: center;
+            margin-top: 30px;
+            padding: 20px;
+            background: rgba(255, 255, 255, 0.1);
+            border-radius: 10px;
+        }
+        .score {
+            font-size: 3em;
+            font-weight: bold;
+            margin: 10px 0;
+        }
+        .rating {
+            font-size: 1.5em;
+            margin: 10px 0;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🍅 DevMeter</h1>
+        <p class="subtitle">Rate developers like Rotten Tomatoes rates movies</p>
+
+        <form id="analyzeForm">
+            <div class="form-group">
+                <label for="githubUrl">GitHub Profile URL</label>
+                <input type="text" id="githubUrl" name="url"
+                       placeholder="https://github.com/username"
+                       required>
             </div>
+            <button type="submit">Analyze Profile</button>
+        </form>
 
-            <div id="results" style="display: none;">
-                <div class="rating-display">
-                    <div id="score" class="score"></div>
-                    <div id="rating" class="rating"></div>
-                    <div id="recommendation"></div>
-                </div>
-            </div>
+        <div class="example">
+            Example: https://github.com/octocat
         </div>
 
-        <script>
-            document.getElementById('analyzeForm').addEventListener('submit', async (e) => {
-                e.preventDefault();
-                const formData = new FormData(e.target);
-                const url = formData.get('url');
-
-                try {
-                    const response = await fetch('/analyze', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json',
-                        },
-                        body: JSON.stringify({ url: url })
-                    });
-
-                    const data = await response.json();
-
-                    if (data.error) {
-                        alert('Error: ' + data.error);
-                        return;
-                    }
-
-                    // Display results
-                    document.getElementById('score').textContent = data.devmeter.score + '%';
-                    document.getElementById('rating').textContent = data.devmeter.rating;
-                    document.getElementById('recommendation').textContent = data.devmeter.recommendation;
-                    document.getElementById('results').style.display = 'block';
-
-                } catch (error) {
-                    alert('Error analyzing profile: ' + error.message);
+        <div id="results" style="display: none;">
+            <div class="rating-display">
+                <div id="score" class="score"></div>
+                <div id="rating" class="rating"></div>
+                <div id="recommendation"></div>
+            </div>
+        </div>
+    </div>
+
+    <script>
+        document.getElementById('analyzeForm').addEventListener('submit', async (e) => {
+            e.preventDefault();
+            const formData = new FormData(e.target);
+            const url = formData.get('url');
+
+            try {
+                const response = await fetch('/analyze', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                    },
+                    body: JSON.stringify({ url: url })
+                });
+
+                const data = await response.json();
+
+                if (data.error) {
+                    alert('Error: ' + data.error);
+                    return;
                 }
-            });
-        </script>
-    </body>
-    </html>
-    """
-    return render_template_string(html)
+
+                // Display results
+                document.getElementById('score').textContent = data.devmeter.score + '%';
+                document.getElementById('rating').textContent = data.devmeter.rating;
+                document.getElementById('recommendation').textContent = data.devmeter.recommendation;
+                document.getElementById('results').style.display = 'block';
+
+            } catch (error) {
+                alert('Error analyzing profile: ' + error.message);
+            }
+        });
+    </script>
+</body>
+</html>
+"""
+
+# The page has no template variables, so it is encoded once at import
+_INDEX_BODY = INDEX_HTML.encode('utf-8')
+
+
+@app.route('/', methods=['GET'])
+def index():
+    """Serve the main web interface"""
+    response = Response(_INDEX_BODY, mimetype='text/html')
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response
 
 
 @app.route('/analyze', methods=['POST'])
@@ -491,7 +876,7 @@ def analyze():
         # Get GitHub token from environment (optional)
         token = os.getenv('GITHUB_TOKEN')
 
-        result = analyze_github_profile(username, token)
+        result = get_profile_cached(username, token)
         return jsonify(result)
 
     except Exception as e:
@@ -502,7 +887,7 @@ def analyze():
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint"""
-    return jsonify({'status': 'healthy', 'timestamp': datetime.now().isoformat()})
+    return jsonify({'status': 'healthy', 'timestamp': datetime.now()})
 
 
 if __name__ == '__main__':
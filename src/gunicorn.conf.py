@@ -0,0 +1,34 @@
+"""
+Gunicorn settings for DevMeter
+Loaded automatically when gunicorn is started from the app directory
+"""
+
+# preload_app imports the app in the master, so patch before anything else
+# (requests, ssl, threading) is imported or workers end up with blocking I/O
+from gevent import monkey
+monkey.patch_all()
+
+import os  # noqa: E402
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+
+
+def _available_cpus():
+    """CPUs this process may run on, rather than every core on the host"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS
+        return os.cpu_count() or 1
+
+
+# /analyze waits on the GitHub API, and gevent gives each worker many concurrent
+# requests; extra processes would only split the in-memory profile cache
+workers = int(os.getenv('WEB_CONCURRENCY', _available_cpus()))
+worker_class = 'gevent'
+worker_connections = int(os.getenv('WORKER_CONNECTIONS', '100'))
+
+# Import once in the master and fork ready workers that share its code pages
+preload_app = True
+
+# A cold profile fetch can take several GitHub round-trips
+timeout = 90
@@ -0,0 +1,220 @@
+"""
+Shared pytest fixtures for DevMeter tests
+"""
+
+import asyncio
+import hashlib
+import random
+import socket
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlparse
+
+import docker
+import httpx
+import requests
+import pytest
+from requests.adapters import HTTPAdapter
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+IMAGE_NAME = "devmeter-test"
+HTTP_CACHE_VOLUME = "devmeter-gh-cache"
+
+# /analyze payloads sent together by the analyze_responses fixture, with a
+# per-request timeout: GitHub API calls can be slow, but a 400 should be instant
+ANALYZE_PAYLOADS = {
+    "octocat": ({"url": "https://github.com/octocat"}, 60),
+    "jorgedlt": ({"url": "https://github.com/jorgedlt"}, 60),
+    "invalid_url": ({"url": "https://invalid-site.com/user"}, 3),
+    "missing_url": ({}, 3),
+}
+
+# Dedicated port, clear of the 8080 used by docker-compose, `make run` and `make deploy-local`
+TEST_PORT = 18080
+
+
+def _image_tag():
+    """Tag the test image by a hash of everything the Dockerfile copies in"""
+    digest = hashlib.sha256()
+    paths = [PROJECT_ROOT / "Dockerfile", PROJECT_ROOT / "requirements.txt",
+             *sorted((PROJECT_ROOT / "src").rglob("*"))]
+    for path in paths:
+        if path.is_file() and "__pycache__" not in path.parts:
+            digest.update(str(path.relative_to(PROJECT_ROOT)).encode())
+            digest.update(path.read_bytes())
+    return f"{IMAGE_NAME}:{digest.hexdigest()[:12]}"
+
+
+def _docker_host(client):
+    """Host that reaches published ports: localhost for a local socket, else the daemon's"""
+    url = urlparse(client.api.base_url)
+    if url.scheme in ("http+docker", "http+unix", "npipe"):
+        return "localhost"
+    return url.hostname
+
+
+def _use_host_network(client):
+    """Host networking skips docker-proxy, but only a native local Linux daemon shares it"""
+    if not sys.platform.startswith("linux") or _docker_host(client) != "localhost":
+        return False
+    # Docker Desktop on Linux runs the daemon inside a VM
+    return client.info().get("OperatingSystem") != "Docker Desktop"
+
+
+def _port_in_use(port):
+    """Whether something on this machine is already listening on the port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        return sock.connect_ex(("127.0.0.1", port)) == 0
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """Keep-alive HTTP session shared by every integration test"""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def docker_client():
+    """Docker SDK client; skips the requesting tests when no daemon answers"""
+    try:
+        client = docker.from_env()
+        client.ping()
+    except (docker.errors.DockerException, requests.exceptions.RequestException) as e:
+        pytest.skip(f"Docker unavailable: {e}")
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def app_container(docker_client, http_session):
+    """Spin up Docker container for testing, once per test session"""
+    container_name = "devmeter-integration-test"
+    client = docker_client
+
+    def remove_stale_container():
+        """Clean up any existing container"""
+        try:
+            client.containers.get(container_name).remove(force=True)
+        except docker.errors.NotFound:
+            pass
+
+    def ensure_image():
+        """Build only when no image exists for the current sources"""
+        image = _image_tag()
+        try:
+            client.images.get(image)
+            print(f"♻️ Reusing image {image}")
+        except docker.errors.ImageNotFound:
+            built, _ = client.images.build(path=str(PROJECT_ROOT), tag=image,
+                                           cache_from=[f"{IMAGE_NAME}:latest"])
+            built.tag(IMAGE_NAME, "latest")
+        return image
+
+    # The build doesn't depend on the old container being gone, so overlap them
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        cleanup = executor.submit(remove_stale_container)
+        build = executor.submit(ensure_image)
+        cleanup.result()
+        image = build.result()
+
+    # Start container; a server already on the port would answer the probes instead
+    host = _docker_host(client)
+    if host == "localhost" and _port_in_use(TEST_PORT):
+        pytest.fail(f"Port {TEST_PORT} is already in use; stop whatever is listening on it")
+
+    if _use_host_network(client):
+        network = {"network_mode": "host"}
+    else:
+        network = {"ports": {f"{TEST_PORT}/tcp": TEST_PORT}}
+    base_url = f"http://{host}:{TEST_PORT}"
+
+    container = client.containers.run(
+        image,
+        name=container_name,
+        detach=True,
+        **network,
+        environment={"FLASK_DEBUG": "false", "DEVMETER_HTTP_CACHE": "/cache/github",
+                     "PORT": str(TEST_PORT)},
+        # Persist GitHub responses across sessions
+        volumes={HTTP_CACHE_VOLUME: {"bind": "/cache", "mode": "rw"}}
+    )
+
+    # Wait for application to be ready: a startup phase of fast, silent polls,
+    # then slower readiness polls that report each failure, up to a deadline
+    started = time.monotonic()
+    startup_until = started + 10
+    deadline = started + 60
+    attempt = 0
+    last_result = "no response"
+    ready = False
+
+    print("⏳ Waiting for DevMeter application to start...")
+
+    while time.monotonic() < deadline:
+        attempt += 1
+
+        # A container that has already died will never become healthy
+        container.reload()
+        if container.status in {"exited", "dead"}:
+            print(f"❌ Container {container.status} during startup. "
+                  "Container logs (last 200 lines):")
+            print(container.logs(tail=200).decode(errors="replace"))
+            container.remove(force=True)
+            pytest.fail(f"Application container {container.status} before becoming ready")
+
+        try:
+            response = http_session.get(f"{base_url}/health", timeout=5)
+            last_result = f"HTTP {response.status_code}: {response.text[:500]}"
+            if response.status_code == 200:
+                data = response.json()
+                if data.get("status") == "healthy":
+                    ready = True
+                    print(f"✅ Application ready after {attempt} attempts "
+                          f"({time.monotonic() - started:.1f}s)")
+                    break
+        except (requests.exceptions.RequestException, ValueError) as e:
+            last_result = repr(e)
+
+        in_startup = time.monotonic() < startup_until
+        if not in_startup:
+            print(f"⏳ Readiness probe {attempt} failed: {last_result}")
+
+        delay = (0.1 if in_startup else 1.0) * random.uniform(0.8, 1.2)
+        time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+
+    if not ready:
+        # Get logs for debugging
+        print(f"❌ Application failed to start. Last /health result: {last_result}")
+        print("Container logs (last 200 lines):")
+        print(container.logs(tail=200).decode(errors="replace"))
+        container.remove(force=True)
+        pytest.fail("Application failed to start within timeout")
+
+    yield base_url
+
+    # Cleanup; the image stays for reuse (see `make clean-test-images`)
+    print("🧹 Cleaning up test container...")
+    container.stop(timeout=2)
+    container.remove()
+
+
+@pytest.fixture(scope="session")
+def analyze_responses(app_container):
+    """POST every ANALYZE_PAYLOADS entry concurrently; responses keyed the same way"""
+    async def post_all():
+        async with httpx.AsyncClient(base_url=app_container) as client:
+            # A failed request leaves its exception in its slot, so only the test
+            # reading that entry fails
+            responses = await asyncio.gather(
+                *(client.post("/analyze", json=payload, timeout=timeout)
+                  for payload, timeout in ANALYZE_PAYLOADS.values()),
+                return_exceptions=True
+            )
+        return dict(zip(ANALYZE_PAYLOADS, responses))
+
+    return asyncio.run(post_all())
@@ -4,8 +4,11 @@ Tests for DevMeter GitHub Profile Analyzer
 
 import pytest
 import json
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
-from src.app import app, DevMeter, extract_username_from_url, analyze_github_profile
+import src.app as app_module
+from src.app import (app, DevMeter, extract_username_from_url, analyze_github_profile,
+                     get_profile_cached, determine_focus_areas, ProfileStats, _preaggregate)
 
 
 class TestDevMeter:
@@ -49,6 +52,15 @@ class TestDevMeter:
         assert result['score'] <= 30  # Should be low score
         assert 'Rotten' in result['rating']
 
+    def test_calculate_rating_empty_profile(self):
+        """Test rating calculation for a profile with nothing to score"""
+        result = self.devmeter.calculate_rating({'profile': {'followers': 10, 'following': 1}})
+
+        assert result['score'] == 0
+        assert 'Mostly Rotten' in result['rating']
+        assert set(result['category_scores']) == set(self.devmeter.weights)
+        assert all(score == 0.0 for score in result['category_scores'].values())
+
     def test_activity_score_calculation(self):
         """Test activity score calculation"""
         # High activity
@@ -73,6 +85,95 @@ class TestDevMeter:
         score = self.devmeter._calculate_quality_score(data)
         assert score <= 0.3
 
+    def test_consistency_score_calculation(self):
+        """Test consistency score calculation"""
+        recent = (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
+        data = {'repositories': [
+            {'updated_at': recent.replace('+00:00', 'Z')},
+            {'updated_at': recent.replace('+00:00', '')},
+            {'updated_at': '2020-01-01T00:00:00Z'},
+            {'updated_at': 'not-a-date'},
+            {'updated_at': None}
+        ]}
+        score = self.devmeter._calculate_consistency_score(data)
+        assert score == pytest.approx(2 / 5 * 1.5)
+
+        assert self.devmeter._calculate_consistency_score({'repositories': []}) == 0.0
+
+    def test_single_category_scores_match_calculate_rating(self):
+        """Test that the per-category scorers agree with the combined pass"""
+        recent = (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
+        profile_data = {
+            'repositories': [{'is_fork': True, 'updated_at': recent}, {'is_fork': False}],
+            'languages': [('Python', 2), ('Haskell', 1)],
+            'total_stars_received': 7,
+            'recent_activity': 1,
+            'focus_areas': ['web'],
+            'profile': {'followers': 3, 'following': 4}
+        }
+
+        scores = self.devmeter.calculate_rating(profile_data)['category_scores']
+
+        assert scores == {
+            'activity_level': self.devmeter._calculate_activity_score(profile_data),
+            'code_quality': self.devmeter._calculate_quality_score(profile_data),
+            'collaboration': self.devmeter._calculate_collaboration_score(profile_data),
+            'consistency': self.devmeter._calculate_consistency_score(profile_data),
+            'expertise': self.devmeter._calculate_expertise_score(profile_data),
+            'impact': self.devmeter._calculate_impact_score(profile_data)
+        }
+
+    def test_preaggregate_profile_stats(self):
+        """Test that scorer inputs are gathered in one pass"""
+        recent = (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
+        profile_data = {
+            'repositories': [
+                {'is_fork': True, 'updated_at': recent},
+                {'is_fork': False, 'updated_at': '2020-01-01T00:00:00Z'},
+                {'is_fork': False, 'updated_at': None}
+            ],
+            'languages': [('Python', 2), ('Haskell', 1)],
+            'total_stars_received': 7,
+            'recent_activity': 1,
+            'focus_areas': ['web'],
+            'profile': {'followers': 3, 'following': 4}
+        }
+
+        assert _preaggregate(profile_data) == ProfileStats(
+            repo_count=3, recent_activity=1, language_count=2, popular_count=1, fork_count=1,
+            recent_repo_count=1, focus_count=1, total_stars=7, followers=3, following=4
+        )
+
+    def test_score_batch_matches_calculate_rating(self):
+        """Test that batch scoring agrees with single-profile scoring"""
+        profiles = [
+            {
+                'repositories': [{'is_fork': False, 'updated_at': '2024-01-01T00:00:00Z'}] * 25,
+                'languages': [('Python', 10), ('JavaScript', 8), ('Go', 5), ('Rust', 3),
+                              ('TypeScript', 2)],
+                'total_stars_received': 500,
+                'recent_activity': 20,
+                'focus_areas': ['web', 'data', 'devops'],
+                'profile': {'followers': 100, 'following': 50}
+            },
+            {
+                'repositories': [{'is_fork': True, 'updated_at': '2020-01-01T00:00:00Z'}] * 2,
+                'languages': [('Unknown', 1)],
+                'total_stars_received': 0,
+                'recent_activity': 0,
+                'focus_areas': [],
+                'profile': {'followers': 1, 'following': 100}
+            }
+        ]
+        rows = [
+            (25, 20, 5, 5, 0, 0, 3, 500, 100, 50),
+            (2, 0, 1, 0, 2, 0, 0, 0, 1, 100)
+        ]
+
+        expected = [self.devmeter.calculate_rating(p)['score'] for p in profiles]
+        assert self.devmeter.score_batch(rows) == expected
+        assert self.devmeter.score_batch([]) == []
+
 
 class TestURLExtraction:
     """Test GitHub URL parsing"""
@@ -83,7 +184,9 @@ class TestURLExtraction:
             ('https://github.com/octocat', 'octocat'),
             ('https://github.com/user-name', 'user-name'),
             ('https://github.com/test/repo', 'test'),
-            ('github.com/simpleuser', 'simpleuser')
+            ('github.com/simpleuser', 'simpleuser'),
+            ('https://github.com/octocat?tab=repositories', 'octocat'),
+            ('https://github.com/octocat#readme', 'octocat')
         ]
 
         for url, expected in test_cases:
@@ -97,6 +200,7 @@ class TestURLExtraction:
             'https://bitbucket.org/user',
             'not-a-url',
             'https://github.com/',
+            'https://github.com/#top',
             ''
         ]
 
@@ -105,6 +209,31 @@ class TestURLExtraction:
             assert result is None
 
 
+class TestFocusAreas:
+    """Test focus area detection"""
+
+    def test_focus_areas_from_names_and_descriptions(self):
+        """Test that keywords in names and descriptions map to areas"""
+        repos = [
+            {'name': 'dotfiles', 'description': 'Bash scripts for my laptop'},
+            {'name': 'Shop-App', 'description': 'A React Native storefront'},
+            {'name': 'k8s-Deployment', 'description': None}
+        ]
+
+        assert determine_focus_areas(repos) == ['web', 'devops', 'mobile', 'automation']
+
+    def test_focus_areas_limited_to_five(self):
+        """Test that at most five areas are reported"""
+        repos = [{'name': name, 'description': None}
+                 for name in ['flask', 'pandas', 'docker', 'crypto', 'android', 'unity']]
+
+        assert determine_focus_areas(repos) == ['web', 'data', 'devops', 'mobile', 'gaming']
+
+    def test_no_focus_areas(self):
+        """Test that unrelated repositories yield no areas"""
+        assert determine_focus_areas([{'name': 'notes', 'description': 'misc'}]) == []
+
+
 class TestFlaskApp:
     """Test Flask application endpoints"""
 
@@ -122,14 +251,28 @@ class TestFlaskApp:
         assert 'timestamp' in data
         assert data['status'] == 'healthy'
 
+    def test_json_provider_options(self):
+        """Test that the orjson provider honours Flask's JSON options"""
+        assert app.json.dumps({'b': 1, 'a': 2}) == '{"a":2,"b":1}'
+        assert app.json.dumps({'b': 1, 'a': 2}, sort_keys=False) == '{"b":1,"a":2}'
+        assert app.json.dumps({'a': 1}, indent=2) == '{\n  "a": 1\n}'
+
+        # Flask's session serializer asks for compact separators
+        assert app.json.dumps({'b': 1, 'a': [1, 2]}, separators=(',', ':')) == '{"a":[1,2],"b":1}'
+
+        with pytest.raises(TypeError):
+            app.json.dumps({'a': 1}, ensure_ascii=False)
+
     def test_index_endpoint(self):
         """Test main page endpoint"""
         response = self.app.get('/')
         assert response.status_code == 200
         assert b'DevMeter' in response.data
         assert b'GitHub Profile URL' in response.data
+        assert response.mimetype == 'text/html'
+        assert 'max-age=3600' in response.headers['Cache-Control']
 
-    @patch('src.app.analyze_github_profile')
+    @patch('src.app.get_profile_cached')
     def test_analyze_endpoint_success(self, mock_analyze):
         """Test successful profile analysis"""
         mock_analyze.return_value = {
@@ -167,6 +310,112 @@ class TestFlaskApp:
         assert 'error' in data
 
 
+class TestProfileCache:
+    """Test caching of profile analyses"""
+
+    def setup_method(self):
+        app_module._PROFILE_CACHE.clear()
+        app_module._PROFILE_VALIDATORS.clear()
+
+    @patch('src.app._etags_unchanged')
+    @patch('src.app._analyze_profile')
+    def test_repeat_lookup_is_cached(self, mock_analyze, mock_unchanged):
+        """Test that a repeat lookup doesn't hit GitHub again"""
+        mock_analyze.return_value = ({'profile': {'username': 'testuser'}}, ('"a"', '"b"'))
+
+        first = get_profile_cached('testuser')
+        second = get_profile_cached('TestUser')
+
+        assert first is second
+        mock_analyze.assert_called_once_with('testuser', None)
+        # A cold miss has nothing to revalidate
+        mock_unchanged.assert_not_called()
+
+    @patch('src.app._analyze_profile')
+    def test_authenticated_results_cached_separately(self, mock_analyze):
+        """Test that authenticated and anonymous results don't mix"""
+        mock_analyze.return_value = ({'profile': {'username': 'testuser'}}, None)
+
+        get_profile_cached('testuser')
+        get_profile_cached('testuser', 'token')
+
+        assert mock_analyze.call_count == 2
+
+    @patch('src.app._analyze_profile')
+    def test_errors_are_not_cached(self, mock_analyze):
+        """Test that failed analyses are retried"""
+        mock_analyze.return_value = ({'error': 'rate limited'}, None)
+
+        get_profile_cached('testuser')
+        get_profile_cached('testuser')
+
+        assert mock_analyze.call_count == 2
+
+    @patch('src.app.requests.head')
+    @patch('src.app.Github')
+    def test_cold_lookup_keeps_fetched_etags(self, mock_github_class, mock_head):
+        """Test that validators come from the fetch itself, without extra requests"""
+        mock_user = mock_github_class.return_value.get_user.return_value
+        mock_user.configure_mock(etag='"a"', followers=0, following=0)
+        mock_repo = Mock(description=None, language=None, stargazers_count=0, forks_count=0,
+                         created_at=None, updated_at=None, fork=False, etag='"b"')
+        mock_repo.name = 'dotfiles'
+        mock_user.get_repos.return_value = [mock_repo]
+
+        result = get_profile_cached('testuser')
+
+        mock_head.assert_not_called()
+        assert app_module._PROFILE_VALIDATORS[('testuser', False)][:2] == (('"a"', '"b"'), result)
+
+    @patch('src.app.requests.head')
+    @patch('src.app._analyze_profile')
+    def test_stale_result_reused_when_not_modified(self, mock_analyze, mock_head):
+        """Test that an expired result is reused on a 304 response"""
+        stale = {'profile': {'username': 'testuser'}}
+        fetched_at = datetime.now(timezone.utc) - timedelta(days=1)
+        app_module._PROFILE_VALIDATORS[('testuser', False)] = (('"a"', '"b"'), stale, fetched_at)
+        mock_head.return_value.status_code = 304
+
+        result = get_profile_cached('testuser')
+
+        assert result is stale
+        mock_analyze.assert_not_called()
+        assert mock_head.call_args.kwargs['headers']['If-None-Match'] == '"b"'
+        # Reuse doesn't extend the analysis' age
+        assert app_module._PROFILE_VALIDATORS[('testuser', False)][2] == fetched_at
+
+    @patch('src.app.requests.head')
+    @patch('src.app._analyze_profile')
+    def test_stale_result_refetched_when_modified(self, mock_analyze, mock_head):
+        """Test that a changed profile is fetched again with new validators"""
+        app_module._PROFILE_VALIDATORS[('testuser', False)] = (
+            ('"a"', '"b"'), {'stale': True}, datetime.now(timezone.utc)
+        )
+        fresh = {'profile': {'username': 'testuser'}}
+        mock_analyze.return_value = (fresh, ('"c"', '"d"'))
+        mock_head.return_value.status_code = 200
+
+        assert get_profile_cached('testuser') is fresh
+        # The first changed ETag is enough to know a fetch is needed
+        mock_head.assert_called_once()
+        assert app_module._PROFILE_VALIDATORS[('testuser', False)][:2] == (('"c"', '"d"'), fresh)
+
+    @patch('src.app.requests.head')
+    @patch('src.app._analyze_profile')
+    def test_old_result_refetched_without_revalidation(self, mock_analyze, mock_head):
+        """Test that matching ETags don't keep an aging analysis alive forever"""
+        fetched_at = datetime.now(timezone.utc) - app_module.VALIDATOR_MAX_AGE
+        app_module._PROFILE_VALIDATORS[('testuser', False)] = (
+            ('"a"', '"b"'), {'stale': True}, fetched_at
+        )
+        fresh = {'profile': {'username': 'testuser'}}
+        mock_analyze.return_value = (fresh, ('"a"', '"b"'))
+
+        assert get_profile_cached('testuser') is fresh
+        mock_head.assert_not_called()
+        assert app_module._PROFILE_VALIDATORS[('testuser', False)][2] > fetched_at
+
+
 class TestGitHubIntegration:
     """Test GitHub API integration (mocked)"""
 
@@ -192,8 +441,8 @@ class TestGitHubIntegration:
         mock_repo.language = 'Python'
         mock_repo.stargazers_count = 5
         mock_repo.forks_count = 2
-        mock_repo.created_at = None
-        mock_repo.updated_at = None
+        mock_repo.created_at = datetime(2020, 1, 1)
+        mock_repo.updated_at = datetime(2020, 1, 2, 3, 4, 5)
         mock_repo.fork = False
 
         mock_github_instance = Mock()
@@ -203,6 +452,10 @@ class TestGitHubIntegration:
 
         result = analyze_github_profile('testuser')
 
+        # Most recently updated repositories, fetched as a single page
+        mock_user.get_repos.assert_called_once_with(sort='updated', direction='desc')
+        assert mock_github_class.call_args.kwargs['per_page'] == 30
+
         # Check basic structure
         assert 'profile' in result
         assert 'repositories' in result
@@ -214,12 +467,102 @@ class TestGitHubIntegration:
         assert profile['username'] == 'testuser'
         assert profile['name'] == 'Test User'
 
+        # Timestamps match the GraphQL form
+        repo = result['repositories'][0]
+        assert repo['created_at'] == '2020-01-01T00:00:00Z'
+        assert repo['updated_at'] == '2020-01-02T03:04:05Z'
+
         # Check DevMeter rating
         devmeter = result['devmeter']
         assert 'score' in devmeter
         assert 'rating' in devmeter
         assert 'recommendation' in devmeter
 
+    @patch('src.app.requests.post')
+    def test_profile_analysis_graphql(self, mock_post):
+        """Test that an authenticated analysis uses a single GraphQL query"""
+        mock_post.return_value.json.return_value = {
+            'data': {
+                'user': {
+                    'login': 'testuser',
+                    'name': 'Test User',
+                    'bio': 'Test bio',
+                    'location': 'Test City',
+                    'company': 'Test Company',
+                    'websiteUrl': 'https://test.com',
+                    'followers': {'totalCount': 10},
+                    'following': {'totalCount': 5},
+                    'publicRepos': {'totalCount': 8},
+                    'gists': {'totalCount': 2},
+                    'repositories': {
+                        'nodes': [{
+                            'name': 'test-repo',
+                            'description': 'A flask web app',
+                            'primaryLanguage': {'name': 'Python'},
+                            'stargazerCount': 5,
+                            'forkCount': 2,
+                            'createdAt': '2020-01-01T00:00:00Z',
+                            'updatedAt': '2020-01-02T00:00:00Z',
+                            'isFork': False
+                        }, {
+                            'name': 'dotfiles',
+                            'description': None,
+                            'primaryLanguage': None,
+                            'stargazerCount': 1,
+                            'forkCount': 0,
+                            'createdAt': '2020-01-01T00:00:00Z',
+                            'updatedAt': '2020-01-02T00:00:00Z',
+                            'isFork': True
+                        }]
+                    }
+                }
+            }
+        }
+
+        result = analyze_github_profile('testuser', 'token')
+
+        mock_post.assert_called_once()
+        assert result['profile']['username'] == 'testuser'
+        assert result['profile']['followers'] == 10
+        assert result['profile']['public_repos'] == 8
+        assert result['languages'] == [('Python', 1)]
+        assert result['total_stars_received'] == 6
+        assert result['repositories'][0]['language'] == 'Python'
+        assert result['repositories'][1]['is_fork'] is True
+        assert 'web' in result['focus_areas']
+        assert 'devmeter' in result
+
+    @patch('src.app.requests.post')
+    def test_profile_analysis_skips_malformed_timestamps(self, mock_post):
+        """Test that one bad timestamp doesn't fail the whole analysis"""
+        recent = (datetime.now(timezone.utc) - timedelta(days=1)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        node = {'name': 'repo', 'description': None, 'primaryLanguage': None, 'stargazerCount': 0,
+                'forkCount': 0, 'createdAt': recent, 'updatedAt': recent, 'isFork': False}
+        mock_post.return_value.json.return_value = {'data': {'user': {
+            'login': 'testuser', 'name': None, 'bio': None, 'location': None, 'company': None,
+            'websiteUrl': None, 'followers': {'totalCount': 0}, 'following': {'totalCount': 0},
+            'publicRepos': {'totalCount': 2}, 'gists': {'totalCount': 0},
+            'repositories': {'nodes': [node, {**node, 'updatedAt': 'not-a-date'}]}
+        }}}
+
+        result = analyze_github_profile('testuser', 'token')
+
+        assert 'error' not in result
+        assert result['recent_activity'] == 1
+
+    @patch('src.app.requests.post')
+    def test_profile_analysis_graphql_unknown_user(self, mock_post):
+        """Test that GraphQL errors are reported in the response"""
+        mock_post.return_value.json.return_value = {
+            'data': {'user': None},
+            'errors': [{'message': "Could not resolve to a User with the login of 'nobody'."}]
+        }
+
+        result = analyze_github_profile('nobody', 'token')
+
+        assert 'error' in result
+        assert 'nobody' in result['error']
+
 
 if __name__ == '__main__':
     pytest.main([__file__])
\ No newline at end of file
@@ -2,78 +2,31 @@
 Integration tests for DevMeter - Real HTTP calls to running application
 """
 
-import subprocess
-import time
-import requests
+import re
+
 import pytest
-import json
-import os
+
+# Markers the landing page must contain, matched in one pass over the stream
+MAIN_PAGE_NEEDLES = (b"DevMeter", b"GitHub Profile URL")
+MAIN_PAGE_PATTERN = re.compile(b"|".join(re.escape(needle) for needle in MAIN_PAGE_NEEDLES))
+# Bytes carried between chunks so a needle split across a boundary still matches
+MAIN_PAGE_OVERLAP = max(len(needle) for needle in MAIN_PAGE_NEEDLES) - 1
+
+
+def _analyze_response(analyze_responses, name):
+    """Response to one of the concurrent /analyze requests, re-raising its own failure"""
+    response = analyze_responses[name]
+    if isinstance(response, Exception):
+        raise response
+    return response
 
 
 class TestDevMeterIntegration:
     """Full integration tests with real HTTP calls to running DevMeter app"""
 
-    @pytest.fixture(scope="class")
-    def app_container(self):
-        """Spin up Docker container for testing"""
-        container_name = "devmeter-integration-test"
-
-        # Clean up any existing container
-        subprocess.run(["docker", "stop", container_name], capture_output=True)
-        subprocess.run(["docker", "rm", container_name], capture_output=True)
-
-        # Build and start container
-        subprocess.run(["docker", "build", "-t", "devmeter-test", "."], check=True)
-
-        process = subprocess.Popen([
-            "docker", "run", "-d",
-            "--name", container_name,
-            "-p", "8081:8080",
-            "-e", "FLASK_DEBUG=false",
-            "devmeter-test"
-        ])
-
-        # Wait for application to be ready
-        base_url = "http://localhost:8081"
-        max_attempts = 30
-        ready = False
-
-        print("⏳ Waiting for DevMeter application to start...")
-
-        for attempt in range(max_attempts):
-            try:
-                response = requests.get(f"{base_url}/health", timeout=5)
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("status") == "healthy":
-                        ready = True
-                        print(f"✅ Application ready after {attempt + 1} attempts")
-                        break
-            except requests.exceptions.RequestException:
-                pass
-
-            time.sleep(2)
-
-        if not ready:
-            # Get logs for debugging
-            logs = subprocess.run(["docker", "logs", container_name],
-                                capture_output=True, text=True)
-            print("❌ Application failed to start. Container logs:")
-            print(logs.stdout)
-            print(logs.stderr)
-            pytest.fail("Application failed to start within timeout")
-
-        yield base_url
-
-        # Cleanup
-        print("🧹 Cleaning up test container...")
-        subprocess.run(["docker", "stop", container_name], capture_output=True)
-        subprocess.run(["docker", "rm", container_name], capture_output=True)
-        subprocess.run(["docker", "rmi", "devmeter-test"], capture_output=True)
-
-    def test_health_endpoint(self, app_container):
+    def test_health_endpoint(self, app_container, http_session):
         """Test that the health endpoint works"""
-        response = requests.get(f"{app_container}/health")
+        response = http_session.get(f"{app_container}/health")
 
         assert response.status_code == 200
         data = response.json()
@@ -82,27 +35,30 @@ class TestDevMeterIntegration:
 
         print("✅ Health check passed")
 
-    def test_main_page_loads(self, app_container):
+    def test_main_page_loads(self, app_container, http_session):
         """Test that the main web page loads"""
-        response = requests.get(f"{app_container}/")
-
-        assert response.status_code == 200
-        assert b"DevMeter" in response.content
-        assert b"GitHub Profile URL" in response.content
+        # Scan the body as it streams in; stop once every needle has been seen
+        found = set()
+        tail = b""
+        with http_session.get(f"{app_container}/", stream=True, timeout=10) as response:
+            assert response.status_code == 200
+            for chunk in response.iter_content(chunk_size=4096):
+                window = tail + chunk
+                found.update(match.group() for match in MAIN_PAGE_PATTERN.finditer(window))
+                if len(found) == len(MAIN_PAGE_NEEDLES):
+                    break
+                tail = window[-MAIN_PAGE_OVERLAP:]
+
+        assert found == set(MAIN_PAGE_NEEDLES)
 
         print("✅ Main page loads successfully")
 
-    def test_github_profile_analysis_octocat(self, app_container):
-        """Test real GitHub profile analysis with octocat"""
-        payload = {"url": "https://github.com/octocat"}
+    @pytest.mark.parametrize("expected_user", ["octocat", "jorgedlt"])
+    def test_github_profile_analysis(self, analyze_responses, expected_user):
+        """Test real GitHub profile analysis"""
+        print(f"🎯 Testing DevMeter analysis with GitHub profile: {expected_user}")
 
-        print("🎯 Testing DevMeter analysis with GitHub profile: octocat")
-
-        response = requests.post(
-            f"{app_container}/analyze",
-            json=payload,
-            timeout=60  # GitHub API calls can be slow
-        )
+        response = _analyze_response(analyze_responses, expected_user)
 
         assert response.status_code == 200
         data = response.json()
@@ -111,6 +67,7 @@ class TestDevMeterIntegration:
         assert "profile" in data
         assert "devmeter" in data
         assert "repositories" in data
+        assert data["profile"]["username"].lower() == expected_user
 
         # Check DevMeter rating structure
         devmeter = data["devmeter"]
@@ -135,46 +92,9 @@ class TestDevMeterIntegration:
 
         print("✅ Real GitHub profile analysis successful")
 
-    def test_github_profile_analysis_jorgedlt(self, app_container):
-        """Test real GitHub profile analysis with jorgedlt"""
-        payload = {"url": "https://github.com/jorgedlt"}
-
-        print("🎯 Testing DevMeter analysis with GitHub profile: jorgedlt")
-
-        response = requests.post(
-            f"{app_container}/analyze",
-            json=payload,
-            timeout=60
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-
-        # Verify response structure
-        assert "profile" in data
-        assert "devmeter" in data
-
-        devmeter = data["devmeter"]
-        score = devmeter["score"]
-
-        # Print real results
-        print("🎯 REAL DEVMETER ANALYSIS RESULTS:")
-        print(f"   Profile: {data['profile'].get('name', 'N/A')} (@{data['profile'].get('username', 'N/A')})")
-        print(f"   Score: {score}%")
-        print(f"   Rating: {devmeter['rating']}")
-        print(f"   Recommendation: {devmeter['recommendation']}")
-
-        print("✅ Real GitHub profile analysis successful")
-
-    def test_invalid_github_url(self, app_container):
+    def test_invalid_github_url(self, analyze_responses):
         """Test error handling for invalid GitHub URL"""
-        payload = {"url": "https://invalid-site.com/user"}
-
-        response = requests.post(
-            f"{app_container}/analyze",
-            json=payload,
-            timeout=30
-        )
+        response = _analyze_response(analyze_responses, "invalid_url")
 
         assert response.status_code == 400
         data = response.json()
@@ -182,15 +102,9 @@ class TestDevMeterIntegration:
 
         print("✅ Invalid URL error handling works")
 
-    def test_missing_url_parameter(self, app_container):
+    def test_missing_url_parameter(self, analyze_responses):
         """Test error handling for missing URL parameter"""
-        payload = {}
-
-        response = requests.post(
-            f"{app_container}/analyze",
-            json=payload,
-            timeout=30
-        )
+        response = _analyze_response(analyze_responses, "missing_url")
 
         assert response.status_code == 400
         data = response.json()
@@ -198,43 +112,33 @@ class TestDevMeterIntegration:
 
         print("✅ Missing parameter error handling works")
 
-    def test_curl_command_simulation(self, app_container):
-        """Simulate curl command testing"""
-        import subprocess
-
-        # Test health endpoint with curl
-        result = subprocess.run([
-            "curl", "-s", "-o", "/dev/null", "-w", "%{http_code}",
-            f"{app_container}/health"
-        ], capture_output=True, text=True)
-
-        assert result.returncode == 0
-        assert result.stdout.strip() == "200"
+    def test_smoke_requests(self, app_container, http_session):
+        """Replay the smoke-test calls (health code, raw JSON analyze)"""
+        # Test health endpoint status code
+        assert http_session.get(f"{app_container}/health", timeout=5).status_code == 200
 
-        print("✅ Curl command simulation successful")
+        print("✅ Health smoke request successful")
 
-        # Test analysis endpoint with curl
-        curl_cmd = [
-            "curl", "-s", "-X", "POST",
-            "-H", "Content-Type: application/json",
-            "-d", '{"url": "https://github.com/octocat"}',
-            f"{app_container}/analyze"
-        ]
-
-        result = subprocess.run(curl_cmd, capture_output=True, text=True)
+        # Test analysis endpoint with a hand-written JSON body
+        response = http_session.post(
+            f"{app_container}/analyze",
+            data='{"url": "https://github.com/octocat"}',
+            headers={"Content-Type": "application/json"},
+            timeout=60
+        )
 
-        assert result.returncode == 0
+        assert response.status_code == 200
 
         # Parse JSON response
         try:
-            data = json.loads(result.stdout)
-            assert "devmeter" in data
-            assert "score" in data["devmeter"]
+            data = response.json()
+        except ValueError:
+            pytest.fail("Analyze response is not valid JSON")
 
-            print(f"✅ Curl analysis result: {data['devmeter']['score']}% {data['devmeter']['rating']}")
+        assert "devmeter" in data
+        assert "score" in data["devmeter"]
 
-        except json.JSONDecodeError:
-            pytest.fail("Curl response is not valid JSON")
+        print(f"✅ Smoke analysis result: {data['devmeter']['score']}% {data['devmeter']['rating']}")
 
 
 if __name__ == "__main__":